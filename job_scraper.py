@@ -9,12 +9,17 @@ import csv
 import json
 import os
 import re
+import sqlite3
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from jobspy import scrape_jobs
@@ -36,10 +41,217 @@ try:
 except ImportError:
     UNDETECTED_CHROME_AVAILABLE = False
 
+# Arrow-backed string storage and CSV writing (optional)
+try:
+    import pyarrow
+    import pyarrow.csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Fast JSON serialization for JSON output (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Multi-pattern DFA matching for keyword filters (optional)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def _build_hyperscan_database(keywords: Tuple[str, ...], case_sensitive: bool):
+    """Compile literal keywords into a Hyperscan block-mode database, cached per keyword set"""
+    flags = hyperscan.HS_FLAG_SINGLEMATCH
+    if not case_sensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[re.escape(kw).encode('utf-8') for kw in keywords],
+        ids=list(range(len(keywords))),
+        flags=[flags] * len(keywords)
+    )
+    return database
+
+
+def _hyperscan_mask(database, descriptions: pd.Series) -> np.ndarray:
+    """Scan each description for all keywords at once, stopping at the first match"""
+    mask = np.zeros(len(descriptions), dtype=bool)
+    
+    def on_match(pattern_id, start, end, flags, context):
+        context[0] = True
+        return True  # Stop scanning this description at the first hit
+    
+    for i, text in enumerate(descriptions):
+        if not isinstance(text, str) or not text:
+            continue
+        found = [False]
+        try:
+            database.scan(text.encode('utf-8'), match_event_handler=on_match, context=found)
+        except hyperscan.ScanTerminated:
+            pass
+        mask[i] = found[0]
+    
+    return mask
+
+
+def _write_csv(jobs_df: pd.DataFrame, output_path):
+    """Write a fully quoted CSV, using Arrow's native writer when available"""
+    if PYARROW_AVAILABLE:
+        try:
+            # Render values the way DataFrame.to_csv does (True, 1.0, "" for nulls) so
+            # the file is identical whichever writer is used
+            text_df = jobs_df.astype(str).where(jobs_df.notna(), '')
+            table = pyarrow.Table.from_pandas(text_df, preserve_index=False)
+            pyarrow.csv.write_csv(
+                table, str(output_path),
+                write_options=pyarrow.csv.WriteOptions(quoting_style='all_valid')
+            )
+            return
+        except (pyarrow.ArrowException, TypeError, ValueError):
+            pass
+    
+    jobs_df.to_csv(output_path, index=False, quoting=csv.QUOTE_ALL)
+
+
+def _json_default(value):
+    """Serialize NA and dates the way DataFrame.to_json does (epoch milliseconds)"""
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, date):
+        return pd.Timestamp(value).value // 1_000_000
+    return str(value)
+
+
+def _write_json(jobs_df: pd.DataFrame, output_path):
+    """Write records as indented JSON, using orjson when available"""
+    if not ORJSON_AVAILABLE:
+        jobs_df.to_json(output_path, orient='records', indent=2)
+        return
+    
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(
+            jobs_df.to_dict(orient='records'),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY,
+            default=_json_default
+        ))
+
+
+def _reduce_keywords(keywords: List[str]) -> List[str]:
+    """Drop keywords that contain another keyword, since the shorter one already matches"""
+    unique = list(dict.fromkeys(kw for kw in keywords if kw))
+    return [
+        kw for kw in unique
+        if not any(other != kw and other in kw for other in unique)
+    ]
+
+
+def _literal_mask(descriptions: pd.Series, keywords: Tuple[str, ...]) -> np.ndarray:
+    """Match literal keywords without Hyperscan, picking the fastest approach for the dtype"""
+    # Each Arrow str.contains is a full pass over the column, so one escaped
+    # alternation beats a pass per keyword there
+    if getattr(descriptions.dtype, 'storage', None) == 'pyarrow' or isinstance(descriptions.dtype, pd.ArrowDtype):
+        pattern = '|'.join(re.escape(kw) for kw in keywords)
+        return descriptions.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+    
+    # Object dtype: plain substring checks avoid the regex engine per row
+    mask = np.zeros(len(descriptions), dtype=bool)
+    for kw in keywords:
+        # Descriptions that already matched an earlier keyword don't need another scan
+        pending = ~mask
+        if not pending.any():
+            break
+        mask[pending] = descriptions[pending].str.contains(kw, regex=False, na=False).to_numpy(dtype=bool)
+    
+    return mask
+
+
+class JobPool:
+    """SQLite-backed pool of jobs seen in previous runs"""
+    
+    def __init__(self, db_path: str):
+        """Open (or create) the pool database"""
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                source TEXT NOT NULL,
+                external_id TEXT NOT NULL,
+                job_url TEXT,
+                seen_at TEXT NOT NULL,
+                PRIMARY KEY (source, external_id)
+            )
+            """
+        )
+        self.conn.commit()
+    
+    @staticmethod
+    def job_keys(jobs_df: pd.DataFrame) -> List[Optional[Tuple[str, str]]]:
+        """Get the (source, external_id) pool key for each job, or None if it has no id"""
+        # Fall back to the URL when a site doesn't provide its own job id
+        urls = jobs_df['job_url']
+        ids = jobs_df['id'].fillna(urls) if 'id' in jobs_df.columns else urls
+        return [
+            (str(source), str(external_id)) if pd.notna(external_id) else None
+            for source, external_id in zip(jobs_df['site'], ids)
+        ]
+    
+    def known_keys(self) -> Set[Tuple[str, str]]:
+        """Get the (source, external_id) keys of all jobs already in the pool"""
+        rows = self.conn.execute("SELECT source, external_id FROM jobs")
+        return {(row[0], row[1]) for row in rows}
+    
+    def insert_many(self, jobs_df: pd.DataFrame, on_conflict: str = 'skip') -> int:
+        """Add jobs to the pool, keyed by (site, id), and return the number of rows written"""
+        if jobs_df.empty:
+            return 0
+        
+        verb = {'skip': 'INSERT OR IGNORE', 'replace': 'INSERT OR REPLACE'}[on_conflict]
+        seen_at = datetime.now().isoformat()
+        
+        rows = [
+            (key[0], key[1], url if pd.notna(url) else None, seen_at)
+            for key, url in zip(self.job_keys(jobs_df), jobs_df['job_url'])
+            if key is not None
+        ]
+        
+        before = self.conn.total_changes
+        self.conn.executemany(
+            f"{verb} INTO jobs (source, external_id, job_url, seen_at) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+    
+    def expire_older_than(self, days: int) -> int:
+        """Remove jobs first seen more than `days` days ago so they get scraped again"""
+        # A cutoff in the future would delete the whole pool
+        if days < 1:
+            raise ValueError(f"days must be at least 1, got {days}")
+        
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        cursor = self.conn.execute("DELETE FROM jobs WHERE seen_at < ?", (cutoff,))
+        self.conn.commit()
+        return cursor.rowcount
+    
+    def close(self):
+        """Close the pool database"""
+        self.conn.close()
+
 
 class JobScraper:
     """Main job scraper class"""
     
+    # Upper bound on concurrent searches to avoid tripping rate limits
+    MAX_WORKERS = 16
+    
     DEFAULT_CONFIG = {
         'job_roles': ['DevOps Engineer', 'Site Reliability Engineer'],
         'countries': ['germany', 'netherlands', 'sweden', 'spain', 'belgium', 'austria'],
@@ -97,6 +309,11 @@ class JobScraper:
             'headless': False,  # Must be False for manual solving
             'wait_timeout': 300,  # Max seconds to wait for manual CAPTCHA solving
             'glassdoor_only': True  # Only use browser automation for Glassdoor
+        },
+        'job_pool': {
+            'enabled': False,  # Skip jobs already seen in previous runs
+            'path': 'results/job_pool.db',  # SQLite database of seen jobs
+            'refresh_older_than_days': None  # Forget pooled jobs older than this
         }
     }
     
@@ -114,6 +331,7 @@ class JobScraper:
             'by_site': {},
             'by_country': {}
         }
+        self._stats_lock = threading.Lock()  # Searches update stats from worker threads
         self.driver = None  # Browser driver for CAPTCHA handling
     
     def load_config(self, config_path: str):
@@ -273,115 +491,133 @@ class JobScraper:
         
         return enabled
     
-    def compile_visa_keywords_pattern(self) -> re.Pattern:
-        """Compile regex pattern for visa sponsorship keywords"""
-        keywords = self.config['visa_keywords']
-        # Escape special regex characters and join with OR
-        escaped = [re.escape(kw) for kw in keywords]
-        pattern = '|'.join(escaped)
+    def _normalize_keywords(self, keywords: List[str]) -> List[str]:
+        """Lower-case keywords to match the lower-cased description column"""
+        if not self.config['filters']['case_sensitive']:
+            keywords = [kw.lower() for kw in keywords]
+        return _reduce_keywords(keywords)
+    
+    def _description_series(self, jobs_df: pd.DataFrame, desc_col: str) -> pd.Series:
+        """Get the description column to scan, lower-cased for the case-insensitive fallback"""
+        if desc_col in jobs_df.columns:
+            return jobs_df[desc_col]
         
-        flags = re.IGNORECASE if not self.config['filters']['case_sensitive'] else 0
-        return re.compile(pattern, flags)
+        # Hyperscan matches caselessly itself, so it scans the raw descriptions
+        descriptions = jobs_df['description']
+        if not self.config['filters']['case_sensitive'] and not HYPERSCAN_AVAILABLE:
+            descriptions = descriptions.str.lower()
+        return descriptions
     
-    def compile_exclusion_keywords_pattern(self) -> re.Pattern:
-        """Compile regex pattern for exclusion keywords"""
-        keywords = self.config.get('exclusion_keywords', [])
-        if not keywords:
-            return None
+    def _keyword_mask(self, descriptions: pd.Series, keywords: List[str]) -> np.ndarray:
+        """Match descriptions against keywords with Hyperscan, or plain substring checks without it"""
+        keywords = tuple(self._normalize_keywords(keywords))
         
-        # Escape special regex characters and join with OR
-        escaped = [re.escape(kw) for kw in keywords]
-        pattern = '|'.join(escaped)
+        # An empty keyword list is an empty pattern, which matches every description
+        if not keywords:
+            return np.ones(len(descriptions), dtype=bool)
         
-        flags = re.IGNORECASE if not self.config['filters']['case_sensitive'] else 0
-        return re.compile(pattern, flags)
+        if HYPERSCAN_AVAILABLE:
+            database = _build_hyperscan_database(keywords, self.config['filters']['case_sensitive'])
+            return _hyperscan_mask(database, descriptions)
+        return _literal_mask(descriptions, keywords)
     
-    def filter_by_exclusion(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
-        """Filter out jobs containing exclusion keywords (e.g., EU citizenship requirements)"""
-        if not self.config['filters'].get('exclusion_filter', False):
+    def _excl_mask(self, descriptions: pd.Series) -> np.ndarray:
+        """Boolean mask of descriptions containing exclusion keywords"""
+        return self._keyword_mask(descriptions, self.config['exclusion_keywords'])
+    
+    def _visa_mask(self, descriptions: pd.Series) -> np.ndarray:
+        """Boolean mask of descriptions containing visa sponsorship keywords"""
+        return self._keyword_mask(descriptions, self.config['visa_keywords'])
+    
+    def apply_filters(self, jobs_df: pd.DataFrame, desc_col: str = '_desc_lower',
+                      exclusion: bool = True, visa: bool = True) -> pd.DataFrame:
+        """Apply exclusion and visa sponsorship filters, selecting matching rows only once"""
+        run_exclusion = exclusion and self.config['filters'].get('exclusion_filter', False)
+        run_visa = visa and self.config['filters']['visa_sponsorship_filter']
+        
+        if exclusion and not run_exclusion:
             print("ℹ Exclusion filter is disabled")
-            return jobs_df
+        if visa and not run_visa:
+            print("ℹ Visa sponsorship filter is disabled")
         
-        if jobs_df.empty:
-            return jobs_df
+        if run_exclusion and not self.config.get('exclusion_keywords', []):
+            run_exclusion = False
         
-        pattern = self.compile_exclusion_keywords_pattern()
-        if pattern is None:
+        if jobs_df.empty or not (run_exclusion or run_visa):
             return jobs_df
         
-        print(f"\n🚫 Filtering out jobs with exclusion keywords...")
-        print(f"   Excluding: EU citizenship requirements, etc.")
-        
-        original_count = len(jobs_df)
-        
         # Check if description column exists
         if 'description' not in jobs_df.columns:
-            print("⚠ Warning: No description column found, skipping exclusion filter")
-            return jobs_df
-        
-        # Fill NaN descriptions with empty string
-        jobs_df['description'] = jobs_df['description'].fillna('')
-        
-        # Apply exclusion filter (keep jobs that DON'T match exclusion patterns)
-        mask = ~jobs_df['description'].str.contains(pattern, na=False, regex=True)
-        filtered_df = jobs_df[mask].copy()
-        
-        filtered_count = len(filtered_df)
-        excluded_count = original_count - filtered_count
-        print(f"   ✓ Excluded {excluded_count} jobs with citizenship requirements ({filtered_count} remaining)")
-        
-        return filtered_df
-    
-    def filter_by_visa_sponsorship(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
-        """Filter jobs by visa sponsorship keywords in description"""
-        if not self.config['filters']['visa_sponsorship_filter']:
-            print("ℹ Visa sponsorship filter is disabled")
-            return jobs_df
-        
-        if jobs_df.empty:
+            print("⚠ Warning: No description column found, skipping filters")
             return jobs_df
         
-        print(f"\n🔍 Filtering for visa sponsorship keywords...")
-        print(f"   Keywords: {', '.join(self.config['visa_keywords'][:3])}...")
-        
-        pattern = self.compile_visa_keywords_pattern()
-        
-        # Filter by description
-        original_count = len(jobs_df)
-        
-        # Check if description column exists and is not null
-        if 'description' not in jobs_df.columns:
-            print("⚠ Warning: No description column found, skipping visa filter")
-            return jobs_df
+        descriptions = self._description_series(jobs_df, desc_col)
+        keep = np.ones(len(jobs_df), dtype=bool)
         
-        # Fill NaN descriptions with empty string
-        jobs_df['description'] = jobs_df['description'].fillna('')
+        if run_exclusion:
+            print(f"\n🚫 Filtering out jobs with exclusion keywords...")
+            print(f"   Excluding: EU citizenship requirements, etc.")
+            
+            # Keep jobs that DON'T match exclusion patterns
+            keep &= ~self._excl_mask(descriptions)
+            
+            remaining_count = int(keep.sum())
+            excluded_count = len(jobs_df) - remaining_count
+            print(f"   ✓ Excluded {excluded_count} jobs with citizenship requirements ({remaining_count} remaining)")
         
-        # Apply filter
-        mask = jobs_df['description'].str.contains(pattern, na=False, regex=True)
-        filtered_df = jobs_df[mask].copy()
+        if run_visa:
+            print(f"\n🔍 Filtering for visa sponsorship keywords...")
+            print(f"   Keywords: {', '.join(self.config['visa_keywords'][:3])}...")
+            
+            # Only scan jobs that survived the exclusion filter
+            original_count = int(keep.sum())
+            keep[keep] = self._visa_mask(descriptions[keep])
+            
+            filtered_count = int(keep.sum())
+            print(f"   ✓ Found {filtered_count} jobs with visa sponsorship ({original_count - filtered_count} filtered out)")
         
-        filtered_count = len(filtered_df)
-        print(f"   ✓ Found {filtered_count} jobs with visa sponsorship ({original_count - filtered_count} filtered out)")
+        filtered_df = jobs_df.loc[keep].copy()
         
         # Add a flag column
-        filtered_df['visa_sponsorship_mentioned'] = True
+        if run_visa:
+            filtered_df['visa_sponsorship_mentioned'] = True
         
         return filtered_df
     
-    def scrape_jobs_for_country(self, country: str, role: str) -> pd.DataFrame:
-        """Scrape jobs for a specific country and role"""
-        enabled_sites = self.get_enabled_sites()
-        
-        if not enabled_sites:
-            print("⚠ No job sites enabled!")
-            return pd.DataFrame()
-        
+    def filter_by_exclusion(self, jobs_df: pd.DataFrame, desc_col: str = '_desc_lower') -> pd.DataFrame:
+        """Filter out jobs containing exclusion keywords (e.g., EU citizenship requirements)"""
+        return self.apply_filters(jobs_df, desc_col, visa=False)
+    
+    def filter_by_visa_sponsorship(self, jobs_df: pd.DataFrame, desc_col: str = '_desc_lower') -> pd.DataFrame:
+        """Filter jobs by visa sponsorship keywords in description"""
+        return self.apply_filters(jobs_df, desc_col, exclusion=False)
+    
+    def print_search_banner(self, country: str, role: str, enabled_sites: List[str]):
+        """Print the header shown for each country/role search"""
         print(f"\n{'='*60}")
         print(f"🌍 Country: {country.upper()}")
         print(f"💼 Role: {role}")
         print(f"🔗 Sites: {', '.join(enabled_sites)}")
         print(f"{'='*60}")
+    
+    def scrape_jobs_for_country(self, country: str, role: str,
+                                enabled_sites: Optional[List[str]] = None,
+                                verbose: bool = True) -> pd.DataFrame:
+        """Scrape jobs for a specific country and role
+        
+        With verbose=False the search banner and progress output are left to the
+        caller, so concurrent searches don't interleave on the console.
+        """
+        if enabled_sites is None:
+            enabled_sites = self.get_enabled_sites()
+        search_params = self.config['search_params']
+        
+        if not enabled_sites:
+            print("⚠ No job sites enabled!")
+            return pd.DataFrame()
+        
+        if verbose:
+            self.print_search_banner(country, role, enabled_sites)
         
         # Check if we need to pre-handle CAPTCHA for any sites
         if self.config['captcha']['enabled']:
@@ -397,34 +633,47 @@ class JobScraper:
                             print(f"   ✓ {site} CAPTCHA cleared")
         
         try:
+            # jobspy already scrapes each site in its own thread, so one call covers
+            # all enabled sites in roughly the time of the slowest one
             jobs_df = scrape_jobs(
                 site_name=enabled_sites,
                 search_term=role,
                 location=country,
-                distance=self.config['search_params']['distance'],
-                is_remote=self.config['search_params']['is_remote'],
-                job_type=self.config['search_params']['job_type'],
-                results_wanted=self.config['search_params']['results_per_site'],
-                hours_old=self.config['search_params']['hours_old'],
+                distance=search_params['distance'],
+                is_remote=search_params['is_remote'],
+                job_type=search_params['job_type'],
+                results_wanted=search_params['results_per_site'],
+                hours_old=search_params['hours_old'],
                 country_indeed=country,
                 description_format='markdown',  # Use markdown for descriptions (plain not supported)
-                verbose=1
+                verbose=1 if verbose else 0  # 0 = errors only
             )
             
+            # Arrow-backed descriptions are stored compactly and let .str.contains
+            # use Arrow's vectorized kernels; nulls are handled natively via na=False
+            if PYARROW_AVAILABLE and 'description' in jobs_df.columns:
+                jobs_df['description'] = jobs_df['description'].astype('string[pyarrow]')
+            
             if not jobs_df.empty:
+                # Drop duplicates within this search so less data reaches pd.concat
+                jobs_df = jobs_df.drop_duplicates(subset=['job_url'], keep='first')
+                
                 # Add metadata
                 jobs_df['search_country'] = country
                 jobs_df['search_role'] = role
                 jobs_df['scraped_at'] = datetime.now().isoformat()
                 
-                print(f"✓ Scraped {len(jobs_df)} jobs")
+                if verbose:
+                    print(f"✓ Scraped {len(jobs_df)} jobs")
                 
                 # Update stats
-                self.stats['total_scraped'] += len(jobs_df)
-                self.stats['by_country'][country] = self.stats['by_country'].get(country, 0) + len(jobs_df)
-                
-                for site in jobs_df['site'].unique():
-                    self.stats['by_site'][site] = self.stats['by_site'].get(site, 0) + len(jobs_df[jobs_df['site'] == site])
+                site_counts = jobs_df['site'].value_counts()
+                with self._stats_lock:
+                    self.stats['total_scraped'] += len(jobs_df)
+                    self.stats['by_country'][country] = self.stats['by_country'].get(country, 0) + len(jobs_df)
+                    
+                    for site, count in site_counts.items():
+                        self.stats['by_site'][site] = self.stats['by_site'].get(site, 0) + int(count)
             
             return jobs_df
         
@@ -434,25 +683,75 @@ class JobScraper:
     
     def scrape_all(self) -> pd.DataFrame:
         """Scrape all configured countries and roles"""
-        all_jobs = []
-        
-        total_combinations = len(self.config['countries']) * len(self.config['job_roles'])
-        current = 0
+        combinations = [
+            (country, role)
+            for country in self.config['countries']
+            for role in self.config['job_roles']
+        ]
+        total_combinations = len(combinations)
         
         print(f"\n🚀 Starting job search...")
         print(f"   Roles: {len(self.config['job_roles'])}")
         print(f"   Countries: {len(self.config['countries'])}")
         print(f"   Total searches: {total_combinations}")
         
-        for country in self.config['countries']:
-            for role in self.config['job_roles']:
-                current += 1
-                print(f"\n[{current}/{total_combinations}] ", end="")
-                
-                jobs_df = self.scrape_jobs_for_country(country, role)
-                
-                if not jobs_df.empty:
-                    all_jobs.append(jobs_df)
+        if not combinations:
+            print("\n⚠ No jobs found!")
+            return pd.DataFrame()
+        
+        # Resolve enabled sites once rather than in every search
+        enabled_sites = self.get_enabled_sites()
+        if not enabled_sites:
+            print("⚠ No job sites enabled!")
+            return pd.DataFrame()
+        
+        # Searches are I/O-bound, so run them concurrently. The CAPTCHA browser
+        # is a single shared driver, so fall back to sequential searches then.
+        max_workers = min(self.MAX_WORKERS, total_combinations)
+        if self.config['captcha']['enabled']:
+            max_workers = 1
+        
+        results = {}
+        if max_workers == 1:
+            for index, (country, role) in enumerate(combinations):
+                print(f"\n[{index + 1}/{total_combinations}] ", end="")
+                results[index] = self.scrape_jobs_for_country(country, role, enabled_sites)
+        else:
+            print(f"   Running up to {max_workers} searches in parallel...")
+            
+            # Workers run quietly; each search is reported here as it completes
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.scrape_jobs_for_country, country, role, enabled_sites, False): index
+                    for index, (country, role) in enumerate(combinations)
+                }
+                for current, future in enumerate(as_completed(futures), start=1):
+                    index = futures[future]
+                    country, role = combinations[index]
+                    jobs_df = future.result()
+                    
+                    print(f"\n[{current}/{total_combinations}] ", end="")
+                    self.print_search_banner(country, role, enabled_sites)
+                    if not jobs_df.empty:
+                        print(f"✓ Scraped {len(jobs_df)} jobs")
+                    results[index] = jobs_df
+        
+        # Remove duplicates based on job_url before concatenating, walking the
+        # configured country/role order so the first occurrence is kept
+        all_jobs = []
+        seen_urls = set()
+        duplicates_removed = 0
+        for index in range(total_combinations):
+            jobs_df = results.pop(index)
+            if jobs_df.empty:
+                continue
+            
+            unique_df = jobs_df[~jobs_df['job_url'].isin(seen_urls)]
+            duplicates_removed += len(jobs_df) - len(unique_df)
+            seen_urls.update(unique_df['job_url'])
+            
+            if not unique_df.empty:
+                all_jobs.append(unique_df)
         
         if not all_jobs:
             print("\n⚠ No jobs found!")
@@ -461,18 +760,52 @@ class JobScraper:
         # Combine all results
         combined_df = pd.concat(all_jobs, ignore_index=True)
         
-        # Remove duplicates based on job_url
-        original_count = len(combined_df)
-        combined_df = combined_df.drop_duplicates(subset=['job_url'], keep='first')
-        duplicates_removed = original_count - len(combined_df)
-        
         if duplicates_removed > 0:
             print(f"\n🔄 Removed {duplicates_removed} duplicate job listings")
         
         print(f"\n📊 Total unique jobs scraped: {len(combined_df)}")
         
+        if self.config['job_pool']['enabled']:
+            combined_df = self.apply_job_pool(combined_df)
+        
         return combined_df
     
+    def apply_job_pool(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
+        """Drop jobs already recorded in the job pool by previous runs"""
+        pool_config = self.config['job_pool']
+        pool = JobPool(pool_config['path'])
+        
+        try:
+            refresh_days = pool_config.get('refresh_older_than_days')
+            if refresh_days is not None:
+                expired = pool.expire_older_than(refresh_days)
+                if expired:
+                    print(f"\n♻️  Expired {expired} pooled jobs older than {refresh_days} days")
+            
+            known_keys = pool.known_keys()
+        finally:
+            pool.close()
+        
+        # Match on the same (source, external_id) key the pool stores
+        is_new = [key is None or key not in known_keys for key in JobPool.job_keys(jobs_df)]
+        new_df = jobs_df[is_new]
+        
+        skipped = len(jobs_df) - len(new_df)
+        if new_df.empty:
+            print(f"\n🗃️  No new jobs since the last run ({skipped} already seen)")
+        elif skipped > 0:
+            print(f"\n🗃️  Skipped {skipped} jobs already seen in previous runs ({len(new_df)} new)")
+        
+        return new_df
+    
+    def record_job_pool(self, jobs_df: pd.DataFrame):
+        """Record jobs in the job pool so later runs skip them"""
+        pool = JobPool(self.config['job_pool']['path'])
+        try:
+            pool.insert_many(jobs_df, on_conflict='skip')
+        finally:
+            pool.close()
+    
     def save_results(self, jobs_df: pd.DataFrame, output_path: Optional[str] = None, suffix: str = ''):
         """Save results to file"""
         if jobs_df.empty:
@@ -487,17 +820,17 @@ class JobScraper:
         if output_path is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = self.config['output']['filename_pattern'].format(timestamp=timestamp)
-            # Add suffix if provided
-            if suffix:
-                filename = filename.replace('.csv', f'{suffix}.csv')
             output_path = output_dir / filename
-        elif suffix:
-            # Add suffix to provided path
-            output_path = Path(str(output_path).replace('.csv', f'{suffix}.csv'))
+        output_path = Path(output_path)
         
-        # Drop description column to prevent CSV formatting issues
-        if 'description' in jobs_df.columns:
-            jobs_df = jobs_df.drop(columns=['description'])
+        # Add suffix if provided
+        if suffix:
+            output_path = output_path.with_name(f'{output_path.stem}{suffix}{output_path.suffix}')
+        
+        # Drop description columns to prevent CSV formatting issues
+        description_columns = [col for col in ('description', '_desc_lower') if col in jobs_df.columns]
+        if description_columns:
+            jobs_df = jobs_df.drop(columns=description_columns)
         
         # Reorder columns for better readability
         priority_columns = [
@@ -517,28 +850,29 @@ class JobScraper:
         output_format = self.config['output']['format'].lower()
         
         if output_format == 'csv':
-            jobs_df.to_csv(output_path, index=False, quoting=csv.QUOTE_ALL)
+            _write_csv(jobs_df, output_path)
             print(f"\n✅ Results saved to: {output_path}")
         elif output_format == 'json':
-            output_path = Path(str(output_path).replace('.csv', '.json'))
-            jobs_df.to_json(output_path, orient='records', indent=2)
+            output_path = output_path.with_suffix('.json')
+            _write_json(jobs_df, output_path)
             print(f"\n✅ Results saved to: {output_path}")
         elif output_format == 'excel':
-            output_path = Path(str(output_path).replace('.csv', '.xlsx'))
+            output_path = output_path.with_suffix('.xlsx')
             jobs_df.to_excel(output_path, index=False)
             print(f"\n✅ Results saved to: {output_path}")
         else:
             print(f"⚠ Unknown format: {output_format}, saving as CSV")
-            jobs_df.to_csv(output_path, index=False, quoting=csv.QUOTE_ALL)
+            _write_csv(jobs_df, output_path)
         
         # Save separate files per site if requested
-        if len(jobs_df['site'].unique()) > 1:
+        if jobs_df['site'].nunique() > 1:
             print(f"\n📑 Saving separate files by site...")
-            for site in jobs_df['site'].unique():
-                site_df = jobs_df[jobs_df['site'] == site]
-                site_filename = str(output_path).replace('.csv', f'_{site}.csv')
-                site_df.to_csv(site_filename, index=False, quoting=csv.QUOTE_ALL)
-                print(f"   ✓ {site}: {len(site_df)} jobs → {Path(site_filename).name}")
+            # Partition once instead of re-scanning the site column per site
+            for site, site_df in jobs_df.groupby('site', sort=False):
+                # Per-site files are always CSV, named after the main output file
+                site_path = output_path.with_name(f'{output_path.stem}_{site}.csv')
+                _write_csv(site_df, site_path)
+                print(f"   ✓ {site}: {len(site_df)} jobs → {site_path.name}")
     
     def print_statistics(self):
         """Print scraping statistics"""
@@ -566,18 +900,39 @@ class JobScraper:
         print("🔍 JOB SCRAPER FOR VISA SPONSORSHIP POSITIONS")
         print("="*60)
         
+        pool_config = self.config['job_pool']
+        refresh_days = pool_config.get('refresh_older_than_days')
+        if refresh_days is not None:
+            # Reject before scraping rather than failing once all searches are done
+            if isinstance(refresh_days, bool) or not isinstance(refresh_days, int) or refresh_days < 1:
+                print(f"❌ refresh_older_than_days must be a whole number of days (1 or more), got {refresh_days!r}")
+                return
+            if not pool_config['enabled']:
+                print("⚠ refresh_older_than_days (--refresh-older-than) has no effect without the job pool (--job-pool)")
+        
         try:
             # Scrape jobs
             jobs_df = self.scrape_all()
             
             if jobs_df.empty:
+                # Jobs may have been scraped and then all skipped by the job pool
+                if self.stats['total_scraped']:
+                    self.print_statistics()
                 return
             
-            # Filter by visa sponsorship
-            filtered_df = self.filter_by_visa_sponsorship(jobs_df)
-            
-            # Apply exclusion filter (remove jobs requiring EU citizenship)
-            filtered_df = self.filter_by_exclusion(filtered_df)
+            filters = self.config['filters']
+            if not (filters['visa_sponsorship_filter'] or filters.get('exclusion_filter', False)):
+                # Nothing to match, so leave the description column untouched
+                print("ℹ Visa sponsorship and exclusion filters are disabled")
+                filtered_df = jobs_df
+            else:
+                # Lower-case descriptions once so both fallback filters can share them;
+                # Hyperscan matches caselessly and doesn't need the copy
+                if 'description' in jobs_df.columns and not filters['case_sensitive'] and not HYPERSCAN_AVAILABLE:
+                    jobs_df['_desc_lower'] = jobs_df['description'].str.lower()
+                
+                # Remove jobs requiring EU citizenship, then filter by visa sponsorship
+                filtered_df = self.apply_filters(jobs_df)
             
             self.stats['after_filter'] = len(filtered_df)
             
@@ -600,6 +955,10 @@ class JobScraper:
                     jobs_df['note'] = 'Unfiltered - may not have visa keywords'
                     self.save_results(jobs_df, output_path, suffix='_all_jobs')
             
+            # Only mark jobs as seen once they have been saved
+            if pool_config['enabled']:
+                self.record_job_pool(jobs_df)
+            
             # Print stats
             self.print_statistics()
         
@@ -678,6 +1037,17 @@ def interactive_mode():
     scraper.run()
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that need a whole number of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -699,6 +1069,9 @@ Examples:
   
   # Change results per site
   python job_scraper.py --results 100 --days 14
+  
+  # Only report jobs not seen in previous runs
+  python job_scraper.py --job-pool --refresh-older-than 30
         """
     )
     
@@ -712,6 +1085,9 @@ Examples:
     parser.add_argument('--no-visa-filter', action='store_true', help='Disable visa sponsorship filter')
     parser.add_argument('-o', '--output', help='Output file path')
     parser.add_argument('--format', choices=['csv', 'json', 'excel'], help='Output format')
+    parser.add_argument('--job-pool', action='store_true', help='Skip jobs already seen in previous runs')
+    parser.add_argument('--refresh-older-than', type=positive_int, metavar='DAYS',
+                        help='Forget pooled jobs older than DAYS so they are scraped again')
     
     args = parser.parse_args()
     
@@ -745,6 +1121,12 @@ Examples:
     if args.format:
         scraper.config['output']['format'] = args.format
     
+    if args.job_pool:
+        scraper.config['job_pool']['enabled'] = True
+    
+    if args.refresh_older_than is not None:
+        scraper.config['job_pool']['refresh_older_than_days'] = args.refresh_older_than
+    
     # Run scraper
     scraper.run(args.output)
 